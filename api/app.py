@@ -7,14 +7,17 @@ from typing import Any
 
 from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from api.routes import auth as auth_routes
 from api.routes import gaming_chat as gaming_routes
 from api.routes import health as health_routes
 from api.routes import subscription as subscription_routes
 from api.routes import voice_chat as voice_chat_routes
+from clients.openai_client import openai_client
+from clients.perplexity_client import perplexity_client
 from core.config import settings
 from schemas.auth import AuthError
 
@@ -47,6 +50,10 @@ async def lifespan(app: FastAPI) -> Any:
     except Exception as e:
         print(f"⚠️ Error closing database: {e}")
 
+    # Close pooled connections to the LLM APIs
+    await openai_client.close()
+    await perplexity_client.close()
+
     print("🛑 Application shutdown complete")
 
 
@@ -61,8 +68,14 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Response compression (HTTP only; WebSocket connections pass through).
+    # Registered first so it sits inside the @app.middleware layers, which
+    # stream bodies in chunks and would otherwise defeat minimum_size.
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+
     # Security Headers Middleware
     @app.middleware("http")
     async def security_headers_middleware(
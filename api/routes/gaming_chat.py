@@ -3,7 +3,7 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.auth import get_current_user
@@ -14,6 +14,7 @@ from database.models import User
 from database.service import DatabaseService
 from schemas.auth import AuthenticatedUser
 from schemas.gaming_chat import (
+    GAMING_CHAT_RESPONSE_ADAPTER,
     ConversationHistoryResponse,
     GamingChatRequest,
     GamingChatResponse,
@@ -31,7 +32,7 @@ async def gaming_chat(
     internal_user: User = Depends(check_request_limits_only),  # noqa: B008
     db_session: AsyncSession = Depends(get_db_session),  # noqa: B008
     _: RateLimited = None,
-) -> GamingChatResponse:
+) -> Response:
     """
     Perform authenticated Gaming Chat with database persistence.
 
@@ -61,14 +62,20 @@ async def gaming_chat(
             reset_date=limit_info["reset_date"],  # type: ignore
         )
 
-        # Perform search with user authentication
-        return await service.search(
+        # Perform search with the user record loaded by the limit check
+        response = await service.search(
             request=request_data,
             user_id=internal_user.id,
-            auth0_user_id=internal_user.auth0_user_id,
+            subscription_tier=internal_user.subscription_tier,
             request_limit_info=request_limit_info,
         )
 
+        # Serialize with the cached adapter to skip FastAPI's response re-validation
+        return Response(
+            content=GAMING_CHAT_RESPONSE_ADAPTER.dump_json(response),
+            media_type="application/json",
+        )
+
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,5 +1,8 @@
 """Subscription management routes."""
 
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 import stripe
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +23,15 @@ from services.subscription_service import SubscriptionService
 
 router = APIRouter()
 
+# Stripe webhook event type -> SubscriptionService handler
+_WEBHOOK_HANDLERS: dict[
+    str, Callable[[SubscriptionService, dict[str, Any]], Awaitable[None]]
+] = {
+    "checkout.session.completed": SubscriptionService.handle_checkout_completed,
+    "customer.subscription.updated": SubscriptionService.handle_subscription_updated,
+    "customer.subscription.deleted": SubscriptionService.handle_subscription_deleted,
+}
+
 
 @router.post("/create-checkout-session", response_model=CheckoutSessionResponse)
 async def create_checkout_session(
@@ -174,31 +186,17 @@ async def stripe_webhook(
     subscription_service = SubscriptionService(db_session)
 
     try:
-        if event["type"] == "checkout.session.completed":
-            session = event["data"]["object"]
-            logger.info(
-                f"Processing checkout.session.completed. Session ID: {session.get('id')}, Customer: {session.get('customer')}, Subscription: {session.get('subscription')}"
-            )
-            await subscription_service.handle_checkout_completed(session)
-            logger.info("Successfully processed checkout.session.completed")
-
-        elif event["type"] == "customer.subscription.updated":
-            subscription = event["data"]["object"]
-            logger.info(
-                f"Processing customer.subscription.updated. Subscription ID: {subscription.get('id')}, Status: {subscription.get('status')}"
-            )
-            await subscription_service.handle_subscription_updated(subscription)
-            logger.info("Successfully processed customer.subscription.updated")
-
-        elif event["type"] == "customer.subscription.deleted":
-            subscription = event["data"]["object"]
+        event_type = event["type"]
+        handler = _WEBHOOK_HANDLERS.get(event_type)
+        if handler is None:
+            logger.info(f"Unhandled webhook event type: {event_type}")
+        else:
+            event_object = event["data"]["object"]
             logger.info(
-                f"Processing customer.subscription.deleted. Subscription ID: {subscription.get('id')}"
+                f"Processing {event_type}. Object ID: {event_object.get('id')}, Customer: {event_object.get('customer')}, Status: {event_object.get('status')}"
             )
-            await subscription_service.handle_subscription_deleted(subscription)
-            logger.info("Successfully processed customer.subscription.deleted")
-        else:
-            logger.info(f"Unhandled webhook event type: {event['type']}")
+            await handler(subscription_service, event_object)
+            logger.info(f"Successfully processed {event_type}")
 
     except Exception as e:
         logger.error(
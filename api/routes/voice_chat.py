@@ -4,9 +4,12 @@ import base64
 import logging
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
 
 from schemas.voice_chat import (
+    MESSAGE_TYPES_BY_VALUE,
     AudioChunkMessage,
     AudioEndMessage,
     AudioStreamChunkMessage,
@@ -56,16 +59,18 @@ class WebSocketConnectionManager:
             del self.active_connections[session_id]
             logger.info(f"WebSocket disconnected for session: {session_id}")
 
-    async def send_json(self, session_id: str, message: dict[str, Any]) -> None:
+    async def send_message(self, session_id: str, message: BaseModel) -> None:
         """
-        Send JSON message to a WebSocket.
+        Send a message model to a WebSocket as JSON.
 
         Args:
             session_id: Session identifier
             message: Message to send
         """
         if session_id in self.active_connections:
-            await self.active_connections[session_id].send_json(message)
+            await self.active_connections[session_id].send_text(
+                message.model_dump_json()
+            )
 
     async def send_bytes(self, session_id: str, data: bytes) -> None:
         """
@@ -109,7 +114,7 @@ async def handle_start_session(data: dict[str, Any], websocket: WebSocket, alrea
 
         # Send confirmation
         response = SessionStartedMessage(session_id=session_id)
-        await manager.send_json(session_id, response.model_dump())
+        await manager.send_message(session_id, response)
 
     except Exception as e:
         logger.error(f"Error starting session: {e}")
@@ -118,7 +123,7 @@ async def handle_start_session(data: dict[str, Any], websocket: WebSocket, alrea
             error=str(e),
             code="session_start_error"
         )
-        await websocket.send_json(error_response.model_dump())
+        await websocket.send_text(error_response.model_dump_json())
 
 
 async def handle_audio_chunk(data: dict[str, Any]) -> None:
@@ -155,7 +160,7 @@ async def handle_audio_chunk(data: dict[str, Any]) -> None:
             error=str(e),
             code="audio_chunk_error"
         )
-        await manager.send_json(data.get("session_id", ""), error_response.model_dump())
+        await manager.send_message(data.get("session_id", ""), error_response)
 
 
 async def handle_audio_end(data: dict[str, Any]) -> None:
@@ -202,7 +207,7 @@ async def handle_audio_end(data: dict[str, Any]) -> None:
         # Step 3: Convert to speech and stream (uses backend-configured voice)
         # Send stream start
         stream_start = AudioStreamStartMessage(session_id=session_id)
-        await manager.send_json(session_id, stream_start.model_dump())
+        await manager.send_message(session_id, stream_start)
 
         # Stream audio chunks using session's voice
         async for audio_chunk in voice_chat_service.text_to_audio_stream(session_id, response_text):
@@ -210,11 +215,11 @@ async def handle_audio_end(data: dict[str, Any]) -> None:
                 session_id=session_id,
                 audio_data=base64.b64encode(audio_chunk).decode('utf-8')
             )
-            await manager.send_json(session_id, chunk_message.model_dump())
+            await manager.send_message(session_id, chunk_message)
 
         # Send stream end
         stream_end = AudioStreamEndMessage(session_id=session_id)
-        await manager.send_json(session_id, stream_end.model_dump())
+        await manager.send_message(session_id, stream_end)
 
     except Exception as e:
         logger.error(f"Error processing audio end: {e}")
@@ -223,7 +228,7 @@ async def handle_audio_end(data: dict[str, Any]) -> None:
             error=str(e),
             code="audio_processing_error"
         )
-        await manager.send_json(data.get("session_id", ""), error_response.model_dump())
+        await manager.send_message(data.get("session_id", ""), error_response)
 
 
 async def handle_end_session(data: dict[str, Any]) -> None:
@@ -246,7 +251,7 @@ async def handle_end_session(data: dict[str, Any]) -> None:
 
         # Send confirmation
         response = SessionEndedMessage(session_id=session_id)
-        await manager.send_json(session_id, response.model_dump())
+        await manager.send_message(session_id, response)
 
         # Disconnect WebSocket
         manager.disconnect(session_id)
@@ -258,7 +263,7 @@ async def handle_end_session(data: dict[str, Any]) -> None:
             error=str(e),
             code="session_end_error"
         )
-        await manager.send_json(data.get("session_id", ""), error_response.model_dump())
+        await manager.send_message(data.get("session_id", ""), error_response)
 
 
 @router.websocket("/ws")
@@ -277,16 +282,20 @@ async def voice_chat_websocket(websocket: WebSocket) -> None:
 
     try:
         # Wait for start session message first
-        data = await websocket.receive_json()
-        message_type = data.get("type")
+        data = orjson.loads(await websocket.receive_text())
+        raw_type = data.get("type")
+        # Non-string types (e.g. lists) are unhashable, so treat them as unknown
+        message_type = (
+            MESSAGE_TYPES_BY_VALUE.get(raw_type) if isinstance(raw_type, str) else None
+        )
 
-        if message_type != MessageType.START_SESSION.value:
+        if message_type is not MessageType.START_SESSION:
             error_response = ErrorMessage(
                 session_id=None,
                 error="First message must be START_SESSION",
                 code="invalid_first_message"
             )
-            await websocket.send_json(error_response.model_dump())
+            await websocket.send_text(error_response.model_dump_json())
             await websocket.close()
             return
 
@@ -297,30 +306,38 @@ async def voice_chat_websocket(websocket: WebSocket) -> None:
         # Process messages
         while True:
             # Receive message
-            message = await websocket.receive_json()
-            message_type = message.get("type")
+            message = orjson.loads(await websocket.receive_text())
+            raw_type = message.get("type")
+            message_type = (
+                MESSAGE_TYPES_BY_VALUE.get(raw_type)
+                if isinstance(raw_type, str)
+                else None
+            )
 
-            logger.info(f"Received message type: {message_type} for session {session_id}")
+            # Logged for every audio chunk, so keep it at debug with lazy formatting
+            logger.debug(
+                "Received message type: %s for session %s", raw_type, session_id
+            )
 
             # Route message to appropriate handler
-            if message_type == MessageType.AUDIO_CHUNK.value:
+            if message_type is MessageType.AUDIO_CHUNK:
                 await handle_audio_chunk(message)
 
-            elif message_type == MessageType.AUDIO_END.value:
+            elif message_type is MessageType.AUDIO_END:
                 await handle_audio_end(message)
 
-            elif message_type == MessageType.END_SESSION.value:
+            elif message_type is MessageType.END_SESSION:
                 await handle_end_session(message)
                 break
 
             else:
-                logger.warning(f"Unknown message type: {message_type}")
+                logger.warning(f"Unknown message type: {raw_type}")
                 error_response = ErrorMessage(
                     session_id=session_id,
-                    error=f"Unknown message type: {message_type}",
+                    error=f"Unknown message type: {raw_type}",
                     code="unknown_message_type"
                 )
-                await manager.send_json(session_id or "", error_response.model_dump())
+                await manager.send_message(session_id or "", error_response)
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session: {session_id}")
@@ -336,7 +353,7 @@ async def voice_chat_websocket(websocket: WebSocket) -> None:
                 error=str(e),
                 code="websocket_error"
             )
-            await manager.send_json(session_id, error_response.model_dump())
+            await manager.send_message(session_id, error_response)
             voice_chat_service.clear_session(session_id)
             manager.disconnect(session_id)
 
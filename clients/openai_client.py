@@ -4,6 +4,7 @@ import io
 from collections.abc import AsyncIterator
 from typing import Any
 
+import httpx
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 
@@ -19,7 +20,20 @@ class OpenAIClient:
 
     def __init__(self) -> None:
         """Initialize OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # One client per process so its connection pool is reused across requests.
+        # The SDK retries rate limits, 5xx, timeouts and connection errors with
+        # jittered exponential backoff (honouring Retry-After); the timeout is
+        # lowered from the 10 minute default so a stalled call fails the turn
+        # instead of hanging the voice session
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=3,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
 
     async def transcribe_audio(self, audio_data: bytes, format: str = "wav") -> str:
         """
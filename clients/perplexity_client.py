@@ -1,11 +1,69 @@
 """Perplexity API client module."""
 
+from functools import lru_cache
 from typing import Any
 
-from perplexity import Perplexity
+import httpx
+from perplexity import AsyncPerplexity, DefaultAsyncHttpxClient
+from perplexity.types.chat import CompletionCreateResponse
 
 from core.config import settings
 
+# Keep every pooled connection alive between bursts (the SDK default keeps only
+# 20 of 100 idle, so the rest pay a fresh TCP/TLS handshake on the next burst)
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=60
+)
+
+# Gaming chat system prompt (placeholders: context, scope, game)
+_SYSTEM_PROMPT_TEMPLATE = (
+    # Persona and objective
+    "You are a precise, helpful gaming assistant.\n"
+    "Always perform retrieval in English, but respond in the user's language and language of the user query.\n"
+    "Your goal is to provide accurate, current information strictly scoped to the specified game.\n\n"
+    # Scope and constraints
+    "MANDATORY GAME CONTEXT (must adhere):\n"
+    "{context}\n\n"
+    "CRITICAL CONSTRAINTS:\n"
+    "- SCOPE: Only answer about {scope}.\n"
+    "- If no {game} information is found, reply exactly: 'No {game} information found'.\n"
+    "- Prefer recent, reputable sources; avoid speculation. If uncertain, say so concisely.\n"
+    "- Some search results might include coordinates, build links, talent import links, etc. You should include these in your response.\n"
+    # Style and output format
+    "STYLE:\n"
+    "- Be concise and actionable, but don't omit important information.\n"
+    "- Maintain a trashtalking tone and a cheeky attitude; use slang when appropriate and roast the user occasionally.\n\n"
+    "FORMATTING RULES:\n"
+    "- NEVER create tables, charts, or comparison tables\n"
+    "- Use clear markdown formatting with headers (##, ###) to organize sections\n"
+    "- Use numbered lists (1., 2., 3.) for step-by-step instructions and sequential processes\n"
+    "- Use bullet points (-) for non-sequential information\n"
+    "- Use **bold text** for emphasis on important steps, warnings, or key concepts\n"
+    "- End with a relevant follow-up question.\n"
+)
+
+
+@lru_cache(maxsize=256)
+def _render_system_prompt(game: str, version: str | None) -> str:
+    """
+    Build the gaming chat system prompt for a game and version.
+
+    Cached because most requests repeat the same few games.
+
+    Args:
+        game: The specific game name
+        version: The game version (optional)
+
+    Returns:
+        System prompt enforcing the game context
+    """
+    context = f"Game: {game} | Version: {version}" if version else f"Game: {game}"
+    scope = f"{game} version {version}" if version else game
+
+    return _SYSTEM_PROMPT_TEMPLATE.format_map(
+        {"context": context, "scope": scope, "game": game}
+    )
+
 
 class PerplexityClient:
     """Client for interacting with Perplexity API."""
@@ -13,16 +71,24 @@ class PerplexityClient:
     def __init__(self) -> None:
         """Initialize the Perplexity client."""
         # API key is now required by Pydantic validation, so no need for manual check
-        self._client = Perplexity(api_key=settings.perplexity_api_key)
+        # Retries (with backoff and Retry-After handling) are done by the SDK
+        self._client = AsyncPerplexity(
+            api_key=settings.perplexity_api_key,
+            http_client=DefaultAsyncHttpxClient(limits=_CONNECTION_LIMITS),
+        )
 
-    def chat_completion(
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
+
+    async def chat_completion(
         self,
         messages: list[dict[str, Any]],
         model: str,
         search_context_size: str,
         max_search_results: int | None = None,
         **kwargs: Any,
-    ) -> Any:
+    ) -> CompletionCreateResponse:
         """
         Create a chat completion using Perplexity API.
 
@@ -47,9 +113,9 @@ class PerplexityClient:
             **kwargs,
         }
 
-        return self._client.chat.completions.create(**params)
+        return await self._client.chat.completions.create(**params)
 
-    def gaming_chat(
+    async def gaming_chat(
         self,
         query: str,
         game: str,
@@ -58,7 +124,7 @@ class PerplexityClient:
         model: str = "sonar",
         search_context_size: str = "low",
         **kwargs: Any,
-    ) -> Any:
+    ) -> CompletionCreateResponse:
         """
         Perform a gaming-specific search query.
 
@@ -77,36 +143,7 @@ class PerplexityClient:
         # Build the message history
         messages = []
 
-        # Build system prompt with integrated game context
-        context_parts = [f"Game: {game}"]
-        if version:
-            context_parts.append(f"Version: {version}")
-
-        system_prompt = (
-            # Persona and objective
-            "You are a precise, helpful gaming assistant.\n"
-            "Always perform retrieval in English, but respond in the user's language and language of the user query.\n"
-            "Your goal is to provide accurate, current information strictly scoped to the specified game.\n\n"
-            # Scope and constraints
-            "MANDATORY GAME CONTEXT (must adhere):\n"
-            f"{' | '.join(context_parts)}\n\n"
-            "CRITICAL CONSTRAINTS:\n"
-            f"- SCOPE: Only answer about {game}{f' version {version}' if version else ''}.\n"
-            f"- If no {game} information is found, reply exactly: 'No {game} information found'.\n"
-            "- Prefer recent, reputable sources; avoid speculation. If uncertain, say so concisely.\n"
-            "- Some search results might include coordinates, build links, talent import links, etc. You should include these in your response.\n"
-            # Style and output format
-            "STYLE:\n"
-            "- Be concise and actionable, but don't omit important information.\n"
-            "- Maintain a trashtalking tone and a cheeky attitude; use slang when appropriate and roast the user occasionally.\n\n"
-            "FORMATTING RULES:\n"
-            "- NEVER create tables, charts, or comparison tables\n"
-            "- Use clear markdown formatting with headers (##, ###) to organize sections\n"
-            "- Use numbered lists (1., 2., 3.) for step-by-step instructions and sequential processes\n"
-            "- Use bullet points (-) for non-sequential information\n"
-            "- Use **bold text** for emphasis on important steps, warnings, or key concepts\n"
-            "- End with a relevant follow-up question.\n"
-        )
+        system_prompt = _render_system_prompt(game, version)
         messages.append({"role": "system", "content": system_prompt})
 
         # Add conversation history if provided
@@ -116,21 +153,21 @@ class PerplexityClient:
         # Add the current user query (game context is already enforced in system prompt)
         messages.append({"role": "user", "content": query})
 
-        return self.chat_completion(
+        return await self.chat_completion(
             messages=messages,
             model=model,
             search_context_size=search_context_size,
             **kwargs,
         )
 
-    def sonar_search(
+    async def sonar_search(
         self,
         query: str,
         model: str = "sonar",
         search_context_size: str = "low",
         max_search_results: int = 5,
         **kwargs: Any,
-    ) -> Any:
+    ) -> CompletionCreateResponse:
         """
         Perform a simple, stateless web search using Perplexity Sonar.
         
@@ -155,7 +192,7 @@ class PerplexityClient:
             }
         ]
 
-        return self.chat_completion(
+        return await self.chat_completion(
             messages=messages,
             model=model,
             search_context_size=search_context_size,
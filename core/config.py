@@ -51,6 +51,15 @@ class Settings(BaseSettings):
 
     # Rate limiting is now handled in-memory (no Redis required)
 
+    # Gaming Chat response cache (in-memory, exact match)
+    chat_cache_ttl: int = Field(
+        default=600, description="Response cache: time to live in seconds"
+    )
+    chat_cache_max_entries: int = Field(
+        default=1024,
+        description="Response cache: maximum cached responses (0 disables)",
+    )
+
     # Perplexity AI (Required)
     perplexity_api_key: str = Field(
         ..., description="Perplexity AI API key", alias="PERPLEXITY_API_KEY"
@@ -96,6 +105,12 @@ class Settings(BaseSettings):
     database_max_overflow: int = Field(
         default=30, description="Database connection pool max overflow"
     )
+    database_pool_timeout: int = Field(
+        default=30, description="Seconds to wait for a pooled connection"
+    )
+    database_pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
     use_null_pool: bool = Field(
         default=True, description="Use NullPool for serverless environments like Neon"
     )
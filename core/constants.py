@@ -38,3 +38,7 @@ SUBSCRIPTION_LIMITS: dict[SubscriptionTier, dict[str, Any]] = {
         "max_monthly_requests": 300,  # Monthly limit for GAMING CHAT
     },
 }
+
+# Conversation history sent to the model (most recent messages only)
+CHAT_HISTORY_MAX_MESSAGES = 20
+CHAT_HISTORY_MAX_CHARS = 8000  # ~2000 tokens
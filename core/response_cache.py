@@ -0,0 +1,86 @@
+"""Simple in-memory cache for LLM responses."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from core.config import settings
+
+
+class InMemoryResponseCache:
+    """Exact-match response cache with TTL expiry and LRU eviction."""
+
+    def __init__(self, max_entries: int, ttl: int) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl: Time to live for each entry in seconds
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        # Cache key -> (expiry time, response), least recently used first
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from JSON-serializable parts.
+
+        Args:
+            *parts: Values identifying the request
+
+        Returns:
+            SHA-256 hex digest of the serialized parts
+        """
+        return hashlib.sha256(orjson.dumps(parts)).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: Any) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+        """
+        if self._max_entries <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._entries.move_to_end(key)
+
+        # Evict least recently used entries over capacity
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global cache for Gaming Chat completions
+chat_response_cache = InMemoryResponseCache(
+    max_entries=settings.chat_cache_max_entries, ttl=settings.chat_cache_ttl
+)
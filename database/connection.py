@@ -2,7 +2,9 @@
 
 import logging
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
@@ -18,7 +20,7 @@ logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
 logging.getLogger("sqlalchemy.dialects").setLevel(logging.WARNING)
 
 # Database engine with security and performance optimizations
-use_null_pool = getattr(settings, "use_null_pool", True)
+use_null_pool = settings.use_null_pool
 
 # Convert database URL to use async driver if needed
 database_url = settings.database_url
@@ -59,11 +61,20 @@ elif database_url.startswith("postgres://"):
     database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
     logger.info("Converted postgres:// URL to postgresql+asyncpg:// for async support")
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
 # Prepare engine arguments
 engine_kwargs = {
     # Security settings
     "echo": False,  # Disable SQL query logging to reduce terminal clutter
     "echo_pool": False,  # Disable pool event logging to reduce terminal clutter
+    # JSONB columns (search results, usage stats, model info) go through orjson
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
     # Connection arguments for cloud database (Neon)
     "connect_args": {
         # For asyncpg, SSL is enabled by default for cloud databases
@@ -83,10 +94,11 @@ else:
     # Connection pool settings for production performance (only when not using NullPool)
     engine_kwargs.update(
         {
-            "pool_size": getattr(settings, "database_pool_size", 20),
-            "max_overflow": getattr(settings, "database_max_overflow", 30),
-            "pool_timeout": 30,  # Timeout for getting connection from pool
-            "pool_recycle": 3600,  # Recycle connections every hour
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            # Replace connections before the server/proxy drops them as idle
+            "pool_recycle": settings.database_pool_recycle,
             "pool_pre_ping": True,  # Verify connections before use
         }
     )
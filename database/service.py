@@ -1,11 +1,11 @@
 """Database service layer with security best practices."""
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, desc, select, update
+from sqlalchemy import and_, desc, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -235,9 +235,9 @@ class DatabaseService:
             User: Updated user record
         """
         try:
-            query = select(User).where(User.id == user_id)
-            result = await self.db.execute(query)
-            user = result.scalar_one_or_none()
+            # Webhook handlers have already loaded the user in this session, so
+            # this is normally served from the identity map without a query
+            user = await self.db.get(User, user_id)
 
             if not user:
                 raise ValueError(f"User {user_id} not found")
@@ -269,9 +269,10 @@ class DatabaseService:
                 user.monthly_requests = 0
                 user.request_count_reset_date = datetime.now(UTC)
 
+            # Every changed column is set here (updated_at explicitly), so the
+            # instance is current after commit without a refresh round-trip
             user.updated_at = datetime.now(UTC)
             await self.db.commit()
-            await self.db.refresh(user)
             return user
 
         except Exception as e:
@@ -335,19 +336,17 @@ class DatabaseService:
         # Return the generated title or fallback
         return title if title else f"{game} Chat"
 
-    async def create_conversation(
+    def _new_conversation(
         self,
         user_id: UUID,
         game_name: str,
-        game_version: str | None = None,
-        title: str | None = None,
-        user_query: str | None = None,
-        conversation_type: str = "chat",
+        game_version: str | None,
+        title: str | None,
+        user_query: str | None,
+        conversation_type: str,
     ) -> Conversation:
         """
-        Create a new conversation for a user.
-
-        Security: Only the authenticated user can create conversations for themselves.
+        Build a new (not yet added) conversation with a generated title.
 
         Args:
             user_id: User ID (from Auth0 token)
@@ -358,44 +357,29 @@ class DatabaseService:
             conversation_type: Type of conversation ('chat')
 
         Returns:
-            Conversation: Created conversation
+            Conversation: Unsaved conversation
         """
-        try:
-            # Generate title from user query if available
-            generated_title = title
-            if not generated_title and user_query:
-                generated_title = self.generate_title_from_query(user_query, game_name)
-            elif not generated_title:
-                type_suffix = (
-                    conversation_type.title()
-                )  # "chat" -> "Chat"
-                generated_title = f"{game_name} {type_suffix}"
-
-            # Create conversation metadata for other flexible data
-            metadata = {
-                "created_via": "api",
-            }
-
-            conversation = Conversation(
-                user_id=user_id,
-                game_name=game_name,
-                game_version=game_version,
-                title=generated_title,
-                conversation_type=conversation_type,  # Use dedicated field
-                conversation_metadata=metadata,
-            )
-
-            self.db.add(conversation)
-            await self.db.commit()
-            await self.db.refresh(conversation)
-
-            logger.info(f"Created conversation {conversation.id}")
-            return conversation
-
-        except Exception as e:
-            logger.error(f"Error creating conversation: {e}")
-            await self.db.rollback()
-            raise
+        # Generate title from user query if available
+        generated_title = title
+        if not generated_title and user_query:
+            generated_title = self.generate_title_from_query(user_query, game_name)
+        elif not generated_title:
+            type_suffix = conversation_type.title()  # "chat" -> "Chat"
+            generated_title = f"{game_name} {type_suffix}"
+
+        # Create conversation metadata for other flexible data
+        metadata = {
+            "created_via": "api",
+        }
+
+        return Conversation(
+            user_id=user_id,
+            game_name=game_name,
+            game_version=game_version,
+            title=generated_title,
+            conversation_type=conversation_type,  # Use dedicated field
+            conversation_metadata=metadata,
+        )
 
     async def get_user_conversations(
         self,
@@ -444,6 +428,33 @@ class DatabaseService:
             logger.error(f"Error getting conversations: {e}")
             raise
 
+    async def get_conversation(
+        self, conversation_id: UUID, user_id: UUID
+    ) -> Conversation | None:
+        """
+        Get a conversation without loading its messages.
+
+        Security: Only returns conversation if owned by the user.
+
+        Args:
+            conversation_id: Conversation ID
+            user_id: User ID (for security check)
+
+        Returns:
+            Optional[Conversation]: Conversation, or None if not found/not owned
+        """
+        try:
+            # Primary key lookup, served from the session's identity map (no
+            # query) when the conversation was already loaded in this request
+            conversation = await self.db.get(Conversation, conversation_id)
+            if conversation is None or conversation.user_id != user_id:
+                return None
+            return conversation
+
+        except Exception as e:
+            logger.error(f"Error getting conversation {conversation_id}: {e}")
+            raise
+
     async def get_conversation_with_messages(
         self, conversation_id: UUID, user_id: UUID, limit: int = 100
     ) -> Conversation | None:
@@ -521,43 +532,146 @@ class DatabaseService:
 
     # ==================== MESSAGE MANAGEMENT ====================
 
-    async def add_message(
+    @staticmethod
+    def _new_exchange(
+        conversation_id: UUID | None,
+        user_content: str,
+        assistant_content: str,
+        search_results: dict[str, Any] | list[dict[str, Any]] | None,
+        usage_stats: dict[str, Any] | None,
+        model_info: dict[str, Any] | None,
+        now: datetime,
+    ) -> tuple[Message, Message]:
+        """
+        Build a user message and the assistant reply (not yet added).
+
+        Timestamps are explicit: server-side now() is the same for every row in
+        a transaction, which would make the pair's order ambiguous.
+
+        Args:
+            conversation_id: Conversation ID (None when attached via the relationship)
+            user_content: User message content
+            assistant_content: Assistant response content
+            search_results: Optional search results from AI
+            usage_stats: Optional usage statistics
+            model_info: Optional model information
+            now: Timestamp for the user message
+
+        Returns:
+            tuple[Message, Message]: Unsaved (user, assistant) messages
+        """
+        user_message = Message(
+            conversation_id=conversation_id,
+            role="user",
+            content=user_content,
+            created_at=now,
+        )
+        assistant_message = Message(
+            conversation_id=conversation_id,
+            role="assistant",
+            content=assistant_content,
+            search_results=search_results,
+            usage_stats=usage_stats,
+            model_info=model_info,
+            created_at=now + timedelta(microseconds=1),
+        )
+        return user_message, assistant_message
+
+    async def create_conversation_with_exchange(
+        self,
+        user_id: UUID,
+        game_name: str,
+        game_version: str | None,
+        user_content: str,
+        assistant_content: str,
+        search_results: dict[str, Any] | list[dict[str, Any]] | None = None,
+        usage_stats: dict[str, Any] | None = None,
+        model_info: dict[str, Any] | None = None,
+        conversation_type: str = "chat",
+    ) -> Conversation:
+        """
+        Create a conversation with its first exchange in a single transaction.
+
+        Security: Only the authenticated user can create conversations for themselves.
+
+        Args:
+            user_id: User ID (from Auth0 token)
+            game_name: Name of the game
+            game_version: Optional game version
+            user_content: User message content (also used for the title)
+            assistant_content: Assistant response content
+            search_results: Optional search results from AI
+            usage_stats: Optional usage statistics
+            model_info: Optional model information
+            conversation_type: Type of conversation ('chat')
+
+        Returns:
+            Conversation: Created conversation
+        """
+        try:
+            conversation = self._new_conversation(
+                user_id=user_id,
+                game_name=game_name,
+                game_version=game_version,
+                title=None,
+                user_query=user_content,
+                conversation_type=conversation_type,
+            )
+            user_message, assistant_message = self._new_exchange(
+                conversation_id=None,
+                user_content=user_content,
+                assistant_content=assistant_content,
+                search_results=search_results,
+                usage_stats=usage_stats,
+                model_info=model_info,
+                now=datetime.now(UTC),
+            )
+
+            # The relationship lets the flush insert the conversation first and
+            # fill in the messages' conversation_id from its generated key
+            conversation.messages = [user_message, assistant_message]
+            self.db.add(conversation)
+            await self.db.commit()
+
+            logger.info(f"Created conversation {conversation.id}")
+            return conversation
+
+        except Exception as e:
+            logger.error(f"Error creating conversation: {e}")
+            await self.db.rollback()
+            raise
+
+    async def add_exchange(
         self,
         conversation_id: UUID,
         user_id: UUID,
-        role: str,
-        content: str,
+        user_content: str,
+        assistant_content: str,
         search_results: dict[str, Any] | list[dict[str, Any]] | None = None,
         usage_stats: dict[str, Any] | None = None,
         model_info: dict[str, Any] | None = None,
-    ) -> Message | None:
+    ) -> tuple[Message, Message] | None:
         """
-        Add a message to a conversation.
+        Add a user message and the assistant reply in a single transaction.
 
         Security: Only allows adding messages to conversations owned by the user.
 
         Args:
             conversation_id: Conversation ID
             user_id: User ID (for security check)
-            role: Message role ('user', 'assistant', 'system')
-            content: Message content
+            user_content: User message content
+            assistant_content: Assistant response content
             search_results: Optional search results from AI
             usage_stats: Optional usage statistics
             model_info: Optional model information
 
         Returns:
-            Optional[Message]: Created message or None if conversation not found/not owned
+            Optional[tuple[Message, Message]]: Created (user, assistant) messages
+            or None if conversation not found/not owned
         """
         try:
             # First verify user owns the conversation
-            conv_query = select(Conversation).where(
-                and_(
-                    Conversation.id == conversation_id, Conversation.user_id == user_id
-                )
-            )
-
-            conv_result = await self.db.execute(conv_query)
-            conversation = conv_result.scalar_one_or_none()
+            conversation = await self.get_conversation(conversation_id, user_id)
 
             if not conversation:
                 logger.warning(
@@ -565,33 +679,40 @@ class DatabaseService:
                 )
                 return None
 
-            # Create message
-            message = Message(
+            now = datetime.now(UTC)
+            user_message, assistant_message = self._new_exchange(
                 conversation_id=conversation_id,
-                role=role,
-                content=content,
+                user_content=user_content,
+                assistant_content=assistant_content,
                 search_results=search_results,
                 usage_stats=usage_stats,
                 model_info=model_info,
+                now=now,
             )
 
-            self.db.add(message)
+            self.db.add_all([user_message, assistant_message])
 
             # Update conversation timestamp
-            conversation.updated_at = datetime.now(UTC)  # type: ignore[assignment]
+            conversation.updated_at = now  # type: ignore[assignment]
 
             await self.db.commit()
-            await self.db.refresh(message)
 
-            return message
+            return user_message, assistant_message
 
         except Exception as e:
-            logger.error(f"Error adding message to conversation {conversation_id}: {e}")
+            logger.error(
+                f"Error adding messages to conversation {conversation_id}: {e}"
+            )
             await self.db.rollback()
             raise
 
     async def get_conversation_messages(
-        self, conversation_id: UUID, user_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        latest: bool = False,
     ) -> list[ConversationMessage]:
         """
         Get messages from a conversation.
@@ -603,40 +724,42 @@ class DatabaseService:
             user_id: User ID (for security check)
             limit: Maximum number of messages
             offset: Pagination offset
+            latest: Page from the newest message backwards instead of the oldest
+                (messages are still returned in chronological order)
 
         Returns:
             list[ConversationMessage]: List of conversation messages
         """
         try:
             # First verify user owns the conversation
-            conv_query = select(Conversation).where(
-                and_(
-                    Conversation.id == conversation_id, Conversation.user_id == user_id
-                )
-            )
-
-            conv_result = await self.db.execute(conv_query)
-            conversation = conv_result.scalar_one_or_none()
+            conversation = await self.get_conversation(conversation_id, user_id)
 
             if not conversation:
                 return []  # Return empty list instead of error for security
 
-            # Get messages
-            query = (
-                select(Message)
-                .where(Message.conversation_id == conversation_id)
-                .order_by(Message.created_at)
-                .limit(limit)
-                .offset(offset)
+            # Get messages (lambda statement: built and compiled once, then
+            # reused with new bound values on every call). Only role and content
+            # are selected, skipping the JSONB columns and ORM instance setup
+            query = lambda_stmt(
+                lambda: select(Message.role, Message.content).where(
+                    Message.conversation_id == conversation_id
+                )
             )
+            if latest:
+                query += lambda s: s.order_by(desc(Message.created_at))
+            else:
+                query += lambda s: s.order_by(Message.created_at)
+            query += lambda s: s.limit(limit).offset(offset)
 
             result = await self.db.execute(query)
-            messages = result.scalars().all()
+            rows = result.all()
+            if latest:
+                rows = rows[::-1]
 
-            # Convert to ConversationMessage format
+            # Rows come from our own database, so skip validation
             return [
-                ConversationMessage(role=msg.role, content=msg.content)  # type: ignore[arg-type]
-                for msg in messages
+                ConversationMessage.model_construct(role=role, content=content)
+                for role, content in rows
             ]
 
         except Exception as e:
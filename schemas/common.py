@@ -1,10 +1,18 @@
 """Common schemas shared across different modules."""
 
-from pydantic import BaseModel, Field
+import sys
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# String type for low-cardinality values (message roles, audio formats)
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class ConversationMessage(BaseModel):
     """Individual message in a conversation."""
 
-    role: str = Field(..., description="Message role (user, assistant, system)")
+    model_config = ConfigDict(frozen=True)
+
+    role: InternedStr = Field(..., description="Message role (user, assistant, system)")
     content: str = Field(..., description="Message content")
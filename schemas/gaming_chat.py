@@ -3,7 +3,7 @@
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from schemas.common import ConversationMessage
 
@@ -11,6 +11,8 @@ from schemas.common import ConversationMessage
 class GamingChatRequest(BaseModel):
     """Request schema for Gaming Chat queries."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(
         ..., min_length=1, max_length=500, description="Gaming Chat query"
     )
@@ -39,6 +41,10 @@ class SearchResult(BaseModel):
 class UsageStats(BaseModel):
     """Token usage statistics from the API response."""
 
+    model_config = ConfigDict(
+        strict=True, frozen=True, extra="forbid", validate_assignment=False
+    )
+
     prompt_tokens: int = Field(..., description="Number of tokens in the prompt")
     completion_tokens: int = Field(
         ..., description="Number of tokens in the completion"
@@ -58,6 +64,10 @@ class UsageStats(BaseModel):
 class RequestLimitInfo(BaseModel):
     """Request limit information for the user's subscription tier."""
 
+    model_config = ConfigDict(
+        strict=True, frozen=True, extra="forbid", validate_assignment=False
+    )
+
     remaining_requests: int = Field(..., description="Number of requests remaining")
     max_requests: int = Field(..., description="Maximum requests allowed")
     limit_type: str = Field(..., description="Type of limit: 'lifetime' or 'monthly'")
@@ -89,9 +99,28 @@ class GamingChatResponse(BaseModel):
     )
 
 
+# Reusable serializer for GamingChatResponse (dump_json returns bytes directly)
+GAMING_CHAT_RESPONSE_ADAPTER = TypeAdapter(GamingChatResponse)
+
+# Serialize one minimal instance at import so the first request skips lazy setup
+GAMING_CHAT_RESPONSE_ADAPTER.dump_json(
+    GamingChatResponse.model_construct(
+        id="",
+        model="",
+        created=0,
+        content="",
+        request_limit_info=RequestLimitInfo.model_construct(
+            remaining_requests=0, max_requests=0, limit_type="lifetime"
+        ),
+    )
+)
+
+
 class ConversationHistoryRequest(BaseModel):
     """Request schema for retrieving conversation history."""
 
+    model_config = ConfigDict(frozen=True)
+
     conversation_id: UUID = Field(..., description="Conversation ID to retrieve")
 
 
@@ -109,6 +138,9 @@ class ConversationHistoryResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response schema."""
 
+    # Rarely instantiated; defer schema construction until first use
+    model_config = ConfigDict(defer_build=True)
+
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Human-readable error message")
     details: dict[str, Any] | None = Field(
@@ -1,5 +1,7 @@
 """Subscription schemas for Stripe integration."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -39,4 +41,4 @@ class WebhookEvent(BaseModel):
     """Stripe webhook event data."""
 
     type: str = Field(..., description="Event type")
-    data: dict = Field(..., description="Event data")
+    data: dict[str, Any] = Field(..., description="Event data")
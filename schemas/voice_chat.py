@@ -3,7 +3,9 @@
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
+
+from schemas.common import InternedStr
 
 
 class MessageType(str, Enum):
@@ -30,105 +32,113 @@ class MessageType(str, Enum):
 class VoiceMessageBase(BaseModel):
     """Base voice chat message."""
 
-    type: MessageType = Field(..., description="Message type")
+    model_config = ConfigDict(frozen=True)
+
+    type: MessageType
 
 
 class StartSessionMessage(VoiceMessageBase):
     """Start a new voice chat session."""
 
     type: Literal[MessageType.START_SESSION] = MessageType.START_SESSION
-    session_id: str = Field(..., description="Unique session identifier")
+    session_id: str  # Unique session identifier
 
 
 class AudioChunkMessage(VoiceMessageBase):
     """Audio chunk from client."""
 
     type: Literal[MessageType.AUDIO_CHUNK] = MessageType.AUDIO_CHUNK
-    session_id: str = Field(..., description="Session identifier")
-    audio_data: str = Field(..., description="Base64 encoded audio data")
-    format: str = Field(default="wav", description="Audio format")
+    session_id: str
+    audio_data: str  # Base64 encoded audio data
+    format: InternedStr = "wav"
 
 
 class AudioEndMessage(VoiceMessageBase):
     """Signal end of audio input."""
 
     type: Literal[MessageType.AUDIO_END] = MessageType.AUDIO_END
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
 
 
 class EndSessionMessage(VoiceMessageBase):
     """End voice chat session."""
 
     type: Literal[MessageType.END_SESSION] = MessageType.END_SESSION
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
 
 
 class TranscriptionMessage(VoiceMessageBase):
     """Transcription result."""
 
     type: Literal[MessageType.TRANSCRIPTION] = MessageType.TRANSCRIPTION
-    session_id: str = Field(..., description="Session identifier")
-    text: str = Field(..., description="Transcribed text")
+    session_id: str
+    text: str
 
 
 class ResponseTextMessage(VoiceMessageBase):
     """Generated text response."""
 
     type: Literal[MessageType.RESPONSE_TEXT] = MessageType.RESPONSE_TEXT
-    session_id: str = Field(..., description="Session identifier")
-    text: str = Field(..., description="Response text")
+    session_id: str
+    text: str
 
 
 class AudioResponseMessage(VoiceMessageBase):
     """Audio response (complete)."""
 
     type: Literal[MessageType.AUDIO_RESPONSE] = MessageType.AUDIO_RESPONSE
-    session_id: str = Field(..., description="Session identifier")
-    audio_data: str = Field(..., description="Base64 encoded audio data")
-    format: str = Field(default="pcm", description="Audio format")
+    session_id: str
+    audio_data: str  # Base64 encoded audio data
+    format: str = "pcm"
 
 
 class AudioStreamStartMessage(VoiceMessageBase):
     """Start of audio stream."""
 
     type: Literal[MessageType.AUDIO_STREAM_START] = MessageType.AUDIO_STREAM_START
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
 
 
 class AudioStreamChunkMessage(VoiceMessageBase):
     """Audio stream chunk."""
 
     type: Literal[MessageType.AUDIO_STREAM_CHUNK] = MessageType.AUDIO_STREAM_CHUNK
-    session_id: str = Field(..., description="Session identifier")
-    audio_data: str = Field(..., description="Base64 encoded audio chunk")
+    session_id: str
+    audio_data: str  # Base64 encoded audio chunk
 
 
 class AudioStreamEndMessage(VoiceMessageBase):
     """End of audio stream."""
 
     type: Literal[MessageType.AUDIO_STREAM_END] = MessageType.AUDIO_STREAM_END
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
 
 
 class ErrorMessage(VoiceMessageBase):
     """Error message."""
 
+    # Only sent on failure paths, so build the schema on first use
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal[MessageType.ERROR] = MessageType.ERROR
-    session_id: str | None = Field(None, description="Session identifier")
-    error: str = Field(..., description="Error message")
-    code: str | None = Field(None, description="Error code")
+    session_id: str | None = None
+    error: str
+    code: str | None = None
 
 
 class SessionStartedMessage(VoiceMessageBase):
     """Session started confirmation."""
 
     type: Literal[MessageType.SESSION_STARTED] = MessageType.SESSION_STARTED
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
 
 
 class SessionEndedMessage(VoiceMessageBase):
     """Session ended confirmation."""
 
     type: Literal[MessageType.SESSION_ENDED] = MessageType.SESSION_ENDED
-    session_id: str = Field(..., description="Session identifier")
+    session_id: str
+
 
+# Message type lookup by raw wire value (avoids Enum.__call__ on every frame)
+MESSAGE_TYPES_BY_VALUE: dict[str, MessageType] = {m.value: m for m in MessageType}
@@ -1,12 +1,18 @@
 """Gaming Chat service with database-backed conversation management."""
 
+import asyncio
 import logging
+import time
+import uuid
 from typing import Any, cast
 from uuid import UUID
 
+from perplexity.types.chat import CompletionCreateResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clients.perplexity_client import perplexity_client
+from core.constants import CHAT_HISTORY_MAX_CHARS, CHAT_HISTORY_MAX_MESSAGES
+from core.response_cache import chat_response_cache
 from database.models import Conversation
 from database.service import DatabaseService
 from schemas.common import ConversationMessage
@@ -17,9 +23,34 @@ from schemas.gaming_chat import (
     SearchResult,
     UsageStats,
 )
+from utils.text_processing import trim_conversation_history
 
 logger = logging.getLogger(__name__)
 
+# Perplexity calls currently running, keyed by response cache key, so identical
+# concurrent requests share one upstream call instead of each making their own
+_in_flight_chats: dict[str, asyncio.Task[CompletionCreateResponse]] = {}
+
+
+def _with_fresh_envelope(
+    response: CompletionCreateResponse,
+) -> CompletionCreateResponse:
+    """
+    Copy a shared completion with its own response ID and creation time.
+
+    Cached and coalesced completions are reused across users and conversations,
+    so each reuse gets a new envelope instead of the upstream ID.
+
+    Args:
+        response: Completion returned by an earlier or concurrent request
+
+    Returns:
+        Shallow copy with a new ID and the current time as created
+    """
+    return response.model_copy(
+        update={"id": str(uuid.uuid4()), "created": int(time.time())}
+    )
+
 
 class GamingChatService:
     """Service for handling Gaming Chat requests with database-backed conversation management."""
@@ -32,7 +63,7 @@ class GamingChatService:
         self,
         request: GamingChatRequest,
         user_id: UUID,
-        auth0_user_id: str,
+        subscription_tier: str,
         request_limit_info: "RequestLimitInfo",
     ) -> GamingChatResponse:
         """
@@ -41,171 +72,127 @@ class GamingChatService:
         Args:
             request: Gaming Chat request
             user_id: User ID from Auth0 token (for security)
-            auth0_user_id: Auth0 user identifier
+            subscription_tier: User's subscription tier ('free' or 'community')
             request_limit_info: Request limit information for the user
 
         Returns:
             Gaming Chat response
         """
         try:
-            # Ensure user exists in database
-            await self.db_service.get_or_create_user(auth0_user_id)
-
-            # Get or create conversation
-            conversation: Conversation
-            if request.conversation_id:
-                # Use existing conversation (verify user owns it)
-                existing_conversation = (
-                    await self.db_service.get_conversation_with_messages(
-                        request.conversation_id, user_id, limit=50
-                    )
-                )
-                if not existing_conversation:
-                    # User doesn't own this conversation, create new one
-                    logger.warning(
-                        "User attempted to access conversation they don't own"
-                    )
-                    conversation = await self.db_service.create_conversation(
-                        user_id=user_id,
-                        game_name=request.game,
-                        game_version=request.version,
-                        user_query=request.query,
-                        conversation_type="chat",
-                    )
-                else:
-                    conversation = existing_conversation
-            else:
-                # Create new conversation
-                conversation = await self.db_service.create_conversation(
-                    user_id=user_id,
-                    game_name=request.game,
-                    game_version=request.version,
-                    user_query=request.query,
-                    conversation_type="chat",
-                )
-
-            # Build conversation history for API
-            conversation_history = []
-            if request.conversation_history:
-                # Use provided history
-                conversation_history = [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in request.conversation_history
-                ]
-            else:
-                # Use stored conversation history (exclude system messages)
-                messages = await self.db_service.get_conversation_messages(
-                    cast(UUID, conversation.id),  # Cast Column[UUID] to UUID for mypy
-                    user_id,
-                    limit=50,
-                )
-                conversation_history = [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in messages
-                    if msg.role != "system"
-                ]
-
-            # Get user to determine subscription tier
-            user = await self.db_service.get_user_by_id(user_id)
-            if not user:
-                raise RuntimeError("User not found")
-
             # Set model and search context based on subscription tier
-            if user.subscription_tier == "community":
+            if subscription_tier == "community":
                 model = "sonar-pro"
                 search_context_size = "medium"
             else:  # free tier
                 model = "sonar"
                 search_context_size = "low"
 
-            # Call Perplexity API with tier-based parameters
-            response = perplexity_client.gaming_chat(
-                query=request.query,
-                game=request.game,
-                conversation_history=conversation_history,
-                version=request.version,
-                model=model,
-                search_context_size=search_context_size,
-            )
+            # With client-provided history the Perplexity call does not depend on
+            # the stored conversation, so start it now and overlap the bookkeeping
+            llm_task: asyncio.Task[CompletionCreateResponse] | None = None
+            if request.conversation_history:
+                conversation_history = trim_conversation_history(
+                    request.conversation_history,
+                    max_messages=CHAT_HISTORY_MAX_MESSAGES,
+                    max_chars=CHAT_HISTORY_MAX_CHARS,
+                )
+                llm_task = asyncio.create_task(
+                    self._gaming_chat(
+                        request, conversation_history, model, search_context_size
+                    )
+                )
+
+            try:
+                conversation = await self._get_conversation(request, user_id)
+            except Exception:
+                if llm_task is not None:
+                    llm_task.cancel()
+                raise
+
+            if llm_task is not None:
+                response = await llm_task
+            else:
+                conversation_history = []
+                if conversation is not None:
+                    # Use stored conversation history (cast Column[UUID] to UUID for mypy)
+                    messages = await self.db_service.get_conversation_messages(
+                        cast(UUID, conversation.id),
+                        user_id,
+                        limit=CHAT_HISTORY_MAX_MESSAGES,
+                        latest=True,
+                    )
+                    conversation_history = trim_conversation_history(
+                        messages,
+                        max_messages=CHAT_HISTORY_MAX_MESSAGES,
+                        max_chars=CHAT_HISTORY_MAX_CHARS,
+                    )
+                response = await self._gaming_chat(
+                    request, conversation_history, model, search_context_size
+                )
 
             # Extract response data
             choice = response.choices[0]
-            assistant_content = choice.message.content
+            # Sonar models reply with plain text (never structured content chunks)
+            assistant_content = cast(str, choice.message.content)
 
-            # Parse search results
+            # Parse search results (the dicts are stored as JSON in the database)
             search_results = []
-            search_results_data = None
-            if hasattr(response, "search_results") and response.search_results:
-                search_results = [
-                    SearchResult(
-                        title=result.title,
-                        url=result.url,
-                        date=getattr(result, "date", None),
-                    )
-                    for result in response.search_results
-                ]
-                # Store search results as JSON for database
+            search_results_data: list[dict[str, Any]] | None = None
+            if response.search_results:
                 search_results_data = [
-                    {
-                        "title": result.title,
-                        "url": result.url,
-                        "date": getattr(result, "date", None),
-                    }
+                    {"title": result.title, "url": result.url, "date": result.date}
                     for result in response.search_results
                 ]
+                search_results = [
+                    SearchResult.model_construct(**result_data)
+                    for result_data in search_results_data
+                ]
 
-            # Parse usage statistics
+            # Parse usage statistics (the dict is stored as JSON in the database)
             usage_stats = None
-            usage_stats_data = None
-            if hasattr(response, "usage") and response.usage:
+            usage_stats_data: dict[str, Any] | None = None
+            if response.usage:
                 usage_data = response.usage
-                usage_stats = UsageStats(
-                    prompt_tokens=usage_data.prompt_tokens,
-                    completion_tokens=usage_data.completion_tokens,
-                    total_tokens=usage_data.total_tokens,
-                    search_context_size=getattr(
-                        usage_data, "search_context_size", None
-                    ),
-                    citation_tokens=getattr(usage_data, "citation_tokens", None),
-                    num_search_queries=getattr(usage_data, "num_search_queries", None),
-                )
-                # Store usage stats as JSON for database
                 usage_stats_data = {
                     "prompt_tokens": usage_data.prompt_tokens,
                     "completion_tokens": usage_data.completion_tokens,
                     "total_tokens": usage_data.total_tokens,
-                    "search_context_size": getattr(
-                        usage_data, "search_context_size", None
-                    ),
-                    "citation_tokens": getattr(usage_data, "citation_tokens", None),
-                    "num_search_queries": getattr(
-                        usage_data, "num_search_queries", None
-                    ),
+                    "search_context_size": usage_data.search_context_size,
+                    "citation_tokens": usage_data.citation_tokens,
+                    "num_search_queries": usage_data.num_search_queries,
                 }
+                usage_stats = UsageStats.model_construct(**usage_stats_data)
 
-            # Store user message in database
-            await self.db_service.add_message(
-                conversation_id=cast(UUID, conversation.id),
-                user_id=user_id,
-                role="user",
-                content=request.query,
-            )
-
-            # Store assistant response in database
-            await self.db_service.add_message(
-                conversation_id=cast(UUID, conversation.id),
-                user_id=user_id,
-                role="assistant",
-                content=assistant_content,
-                search_results=search_results_data,
-                usage_stats=usage_stats_data,
-                model_info={
-                    "model": response.model,
-                    "finish_reason": getattr(choice, "finish_reason", None),
-                },
-            )
+            # Store the user message and assistant response in one transaction
+            # (new conversations are inserted together with their first exchange)
+            model_info = {
+                "model": response.model,
+                "finish_reason": choice.finish_reason,
+            }
+            if conversation is None:
+                conversation = await self.db_service.create_conversation_with_exchange(
+                    user_id=user_id,
+                    game_name=request.game,
+                    game_version=request.version,
+                    user_content=request.query,
+                    assistant_content=assistant_content,
+                    search_results=search_results_data,
+                    usage_stats=usage_stats_data,
+                    model_info=model_info,
+                )
+            else:
+                await self.db_service.add_exchange(
+                    conversation_id=cast(UUID, conversation.id),
+                    user_id=user_id,
+                    user_content=request.query,
+                    assistant_content=assistant_content,
+                    search_results=search_results_data,
+                    usage_stats=usage_stats_data,
+                    model_info=model_info,
+                )
 
-            return GamingChatResponse(
+            # Response is assembled from trusted upstream data, so skip validation
+            return GamingChatResponse.model_construct(
                 id=response.id,
                 conversation_id=cast(UUID, conversation.id),
                 model=response.model,
@@ -213,7 +200,7 @@ class GamingChatService:
                 content=assistant_content,
                 search_results=search_results,
                 usage=usage_stats,
-                finish_reason=getattr(choice, "finish_reason", None),
+                finish_reason=choice.finish_reason,
                 request_limit_info=request_limit_info,
             )
 
@@ -221,6 +208,90 @@ class GamingChatService:
             logger.error(f"Gaming Chat failed: {e}")
             raise RuntimeError(f"Gaming Chat failed: {e!s}") from e
 
+    async def _get_conversation(
+        self, request: GamingChatRequest, user_id: UUID
+    ) -> Conversation | None:
+        """
+        Get the requested conversation if the user owns it.
+
+        New conversations are created after the AI response, together with
+        their first exchange.
+
+        Args:
+            request: Gaming Chat request
+            user_id: User ID (for security)
+
+        Returns:
+            Conversation | None: Existing conversation owned by the user, or None
+        """
+        if not request.conversation_id:
+            return None
+
+        # Use existing conversation (verify user owns it)
+        existing_conversation = await self.db_service.get_conversation(
+            request.conversation_id, user_id
+        )
+        if existing_conversation is None:
+            # User doesn't own this conversation, start a new one
+            logger.warning("User attempted to access conversation they don't own")
+        return existing_conversation
+
+    async def _gaming_chat(
+        self,
+        request: GamingChatRequest,
+        conversation_history: list[dict[str, Any]],
+        model: str,
+        search_context_size: str,
+    ) -> CompletionCreateResponse:
+        """
+        Call Perplexity with tier-based parameters.
+
+        Args:
+            request: Gaming Chat request
+            conversation_history: Previous messages to send as context
+            model: Perplexity model for the user's tier
+            search_context_size: Search context size for the user's tier
+
+        Returns:
+            Chat completion response
+        """
+        # Identical questions with identical context reuse a recent or in-flight
+        # completion
+        cache_key = chat_response_cache.make_key(
+            model,
+            search_context_size,
+            " ".join(request.game.lower().split()),
+            request.version,
+            " ".join(request.query.lower().split()),
+            conversation_history,
+        )
+        cached: CompletionCreateResponse | None = chat_response_cache.get(cache_key)
+        if cached is not None:
+            return _with_fresh_envelope(cached)
+
+        task = _in_flight_chats.get(cache_key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.create_task(
+                perplexity_client.gaming_chat(
+                    query=request.query,
+                    game=request.game,
+                    conversation_history=conversation_history,
+                    version=request.version,
+                    model=model,
+                    search_context_size=search_context_size,
+                )
+            )
+            _in_flight_chats[cache_key] = task
+            task.add_done_callback(lambda _: _in_flight_chats.pop(cache_key, None))
+
+        # Shield the shared call so one caller disconnecting doesn't cancel it
+        response = await asyncio.shield(task)
+        if joined:
+            return _with_fresh_envelope(response)
+        chat_response_cache.set(cache_key, response)
+        return response
+
     async def get_conversation_history(
         self, conversation_id: UUID, user_id: UUID
     ) -> list[ConversationMessage]:
@@ -1,13 +1,33 @@
 """Stripe subscription service."""
 
+import logging
+
 import stripe
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
 from database.models import User
+from database.service import DatabaseService
+
+logger = logging.getLogger(__name__)
 
-# Configure Stripe
+# Checkout parameters shared by every Community checkout session
+_COMMUNITY_CHECKOUT_PARAMS: stripe.checkout.Session.CreateParams = {
+    "payment_method_types": ["card"],
+    "line_items": [
+        {
+            "price": settings.stripe_price_id_community,
+            "quantity": 1,
+        }
+    ],
+    "mode": "subscription",
+    "success_url": settings.stripe_success_url,
+    "cancel_url": settings.stripe_cancel_url,
+}
+
+# Configure Stripe (the *_async methods use the SDK's httpx client, so Stripe
+# calls no longer block the event loop)
 stripe.api_key = settings.stripe_api_key
 
 
@@ -31,34 +51,39 @@ class SubscriptionService:
         Returns:
             Dictionary with checkout_url and session_id
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        # Create or retrieve Stripe customer
-        customer_id = None
-        if user.stripe_customer_id:
+        # Use the stored Stripe customer directly; checkout creation fails with
+        # resource_missing on the customer param if it no longer exists, so no
+        # retrieve preflight (a missing price reports a different param)
+        customer_id = user.stripe_customer_id
+        if customer_id:
+            logger.info(f"Using existing Stripe customer: {customer_id}")
             try:
-                # Try to retrieve the customer to verify it exists
-                stripe.Customer.retrieve(user.stripe_customer_id)
-                customer_id = user.stripe_customer_id
-                logger.info(f"Using existing Stripe customer: {customer_id}")
-            except stripe.StripeError as e:
+                session = await self._create_stripe_checkout_session(user, customer_id)
+            except stripe.InvalidRequestError as e:
+                if e.code != "resource_missing" or e.param != "customer":
+                    raise
                 # Customer doesn't exist (likely deleted or switched between test/live mode)
                 logger.warning(
-                    f"Stripe customer {user.stripe_customer_id} not found: {e}. "
+                    f"Stripe customer {customer_id} not found: {e}. "
                     f"Clearing stale customer ID and searching for existing customers."
                 )
                 # Clear the stale customer ID from database
                 user.stripe_customer_id = None
                 await self.db_session.commit()
                 customer_id = None
+            else:
+                return {
+                    "checkout_url": session.url or "",
+                    "session_id": session.id or "",
+                }
 
         if not customer_id:
             # Before creating a new customer, search for existing ones by email
             # to avoid duplicates
             try:
-                existing_customers = stripe.Customer.list(email=user_email, limit=1)
+                existing_customers = await stripe.Customer.list_async(
+                    email=user_email, limit=1
+                )
                 if existing_customers.data:
                     # Found existing customer with this email
                     existing_customer = existing_customers.data[0]
@@ -75,7 +100,7 @@ class SubscriptionService:
 
         if not customer_id:
             # No existing customer found, create a new one
-            customer = stripe.Customer.create(
+            customer = await stripe.Customer.create_async(
                 email=user_email,
                 metadata={
                     "user_id": str(user.id),
@@ -90,29 +115,36 @@ class SubscriptionService:
             await self.db_session.commit()
 
         # Create checkout session
-        session = stripe.checkout.Session.create(
-            customer=customer_id,
-            payment_method_types=["card"],
-            line_items=[
-                {
-                    "price": settings.stripe_price_id_community,
-                    "quantity": 1,
-                }
-            ],
-            mode="subscription",
-            success_url=settings.stripe_success_url,
-            cancel_url=settings.stripe_cancel_url,
-            metadata={
-                "user_id": str(user.id),
-                "auth0_user_id": str(user.auth0_user_id),
-            },
-        )
+        session = await self._create_stripe_checkout_session(user, customer_id)
 
         return {
             "checkout_url": session.url or "",
             "session_id": session.id or "",
         }
 
+    async def _create_stripe_checkout_session(
+        self, user: User, customer_id: str
+    ) -> stripe.checkout.Session:
+        """
+        Create the Stripe checkout session for a customer.
+
+        Args:
+            user: The database user object
+            customer_id: Stripe customer ID
+
+        Returns:
+            Stripe checkout session
+        """
+        params: stripe.checkout.Session.CreateParams = {
+            **_COMMUNITY_CHECKOUT_PARAMS,
+            "customer": customer_id,
+            "metadata": {
+                "user_id": str(user.id),
+                "auth0_user_id": str(user.auth0_user_id),
+            },
+        }
+        return await stripe.checkout.Session.create_async(**params)
+
     async def cancel_subscription(self, user: User) -> dict[str, str | bool]:
         """
         Cancel user's active subscription.
@@ -129,7 +161,9 @@ class SubscriptionService:
         try:
             subscription_id = user.stripe_subscription_id
             # Cancel the subscription at period end (user keeps access until end of billing period)
-            stripe.Subscription.modify(subscription_id, cancel_at_period_end=True)
+            await stripe.Subscription.modify_async(
+                subscription_id, cancel_at_period_end=True
+            )
 
             # Update user status
             user.subscription_status = "canceling"
@@ -152,10 +186,6 @@ class SubscriptionService:
         Args:
             session: Stripe checkout session data
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         # Extract user info from metadata
         user_id = session.get("metadata", {}).get("user_id")
         logger.info(f"Checkout completed - User ID from metadata: {user_id}")
@@ -194,8 +224,6 @@ class SubscriptionService:
             # Handle tier change with proper counter resets
             if old_tier != "community":
                 logger.info(f"Upgrading user from {old_tier} to community tier")
-                from database.service import DatabaseService
-
                 db_service = DatabaseService(self.db_session)
                 await db_service.handle_subscription_tier_change(
                     user_id=user.id, new_tier="community", old_tier=old_tier
@@ -219,10 +247,6 @@ class SubscriptionService:
         Args:
             subscription: Stripe subscription data
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         customer_id = subscription.get("customer")
         if not customer_id:
             return
@@ -276,8 +300,6 @@ class SubscriptionService:
 
         # Handle tier change with proper counter resets
         if new_tier != old_tier:
-            from database.service import DatabaseService
-
             db_service = DatabaseService(self.db_session)
             await db_service.handle_subscription_tier_change(
                 user_id=user.id, new_tier=new_tier, old_tier=old_tier
@@ -313,8 +335,6 @@ class SubscriptionService:
         user.stripe_subscription_id = None
 
         # Downgrade to free tier with proper counter resets
-        from database.service import DatabaseService
-
         db_service = DatabaseService(self.db_session)
         await db_service.handle_subscription_tier_change(
             user_id=user.id, new_tier="free", old_tier=old_tier
@@ -1,6 +1,8 @@
 """Voice chat service for handling audio conversations."""
 
+import asyncio
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
 from clients.openai_client import (
@@ -8,9 +10,22 @@ from clients.openai_client import (
     DEFAULT_TTS_VOICE,
     openai_client,
 )
+from utils.text_processing import trim_conversation_history
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of live sessions kept in memory (least recently used evicted)
+MAX_VOICE_SESSIONS = 1000
+
+# Maximum number of messages kept per session, including the system prompt
+MAX_VOICE_HISTORY_MESSAGES = 40
+
+# Maximum history content sent with each prompt (roughly 4 chars/token)
+VOICE_PROMPT_MAX_CHARS = 12000
+
+# System message shared by every session (history entries are never mutated)
+_SYSTEM_MESSAGE = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
 
 class VoiceChatService:
     """Service for managing voice chat conversations."""
@@ -18,10 +33,12 @@ class VoiceChatService:
     def __init__(self) -> None:
         """Initialize voice chat service."""
         self.client = openai_client
-        # Store conversation history per session
-        self.conversations: dict[str, list[dict[str, str]]] = {}
+        # Store conversation history per session (least recently used first)
+        self.conversations: OrderedDict[str, list[dict[str, str]]] = OrderedDict()
         # Store voice preference per session
         self.session_voices: dict[str, str] = {}
+        # Serialize history updates per session
+        self._session_locks: dict[str, asyncio.Lock] = {}
 
     def create_session(self, session_id: str) -> None:
         """
@@ -31,14 +48,20 @@ class VoiceChatService:
             session_id: Unique session identifier
         """
         # Initialize with default system prompt
-        self.conversations[session_id] = [{
-            "role": "system",
-            "content": DEFAULT_SYSTEM_PROMPT
-        }]
+        self.conversations[session_id] = [_SYSTEM_MESSAGE]
+        self.conversations.move_to_end(session_id)
         # Set default voice
         self.session_voices[session_id] = DEFAULT_TTS_VOICE
+        # Lock lives exactly as long as the session (removed in clear_session)
+        self._session_locks[session_id] = asyncio.Lock()
         logger.info(f"Created voice chat session: {session_id}")
 
+        # Evict least recently used sessions that were never cleared
+        while len(self.conversations) > MAX_VOICE_SESSIONS:
+            stale_session_id = next(iter(self.conversations))
+            logger.warning(f"Evicting idle voice chat session: {stale_session_id}")
+            self.clear_session(stale_session_id)
+
     def get_conversation_history(self, session_id: str) -> list[dict[str, str]]:
         """
         Get conversation history for a session.
@@ -49,24 +72,65 @@ class VoiceChatService:
         Returns:
             List of conversation messages
         """
-        return self.conversations.get(session_id, [])
+        history = self.conversations.get(session_id)
+        if history is None:
+            return []
+        self.conversations.move_to_end(session_id)
+        return history
 
     def add_to_history(self, session_id: str, role: str, content: str) -> None:
         """
         Add a message to conversation history.
 
+        Messages for unknown (evicted or cleared) sessions are dropped.
+
         Args:
             session_id: Session identifier
             role: Message role (user, assistant, system)
             content: Message content
         """
-        if session_id not in self.conversations:
-            self.conversations[session_id] = []
-        self.conversations[session_id].append({
+        # Evicted or cleared sessions are not re-created here: a bare history
+        # would lack the system prompt and bypass the session cap
+        history = self.conversations.get(session_id)
+        if history is None:
+            logger.warning(f"Ignoring message for unknown session: {session_id}")
+            return
+        history.append({
             "role": role,
             "content": content
         })
 
+        # Drop the oldest turns once over the cap, keeping the system prompt
+        excess = len(history) - MAX_VOICE_HISTORY_MESSAGES
+        if excess > 0:
+            start = 1 if history[0]["role"] == "system" else 0
+            del history[start:start + excess]
+
+    def get_prompt_window(self, session_id: str) -> list[dict[str, str]]:
+        """
+        Get the most recent history that fits the prompt size budget.
+
+        Keeps the system prompt and trims the remaining messages with
+        trim_conversation_history, so prompt size stays constant as a session
+        ages.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            System prompt (if any) followed by the most recent messages,
+            starting with a user message
+        """
+        history = self.get_conversation_history(session_id)
+        kept = trim_conversation_history(
+            history,
+            max_messages=MAX_VOICE_HISTORY_MESSAGES,
+            max_chars=VOICE_PROMPT_MAX_CHARS,
+        )
+        if history and history[0]["role"] == "system":
+            return [history[0], *kept]
+        return kept
+
     def clear_session(self, session_id: str) -> None:
         """
         Clear a conversation session.
@@ -78,6 +142,7 @@ class VoiceChatService:
             del self.conversations[session_id]
         if session_id in self.session_voices:
             del self.session_voices[session_id]
+        self._session_locks.pop(session_id, None)
         logger.info(f"Cleared voice chat session: {session_id}")
 
     async def process_audio_to_text(self, audio_data: bytes, format: str = "wav") -> str:
@@ -109,22 +174,31 @@ class VoiceChatService:
 
         Returns:
             Generated response text
+
+        Raises:
+            ValueError: If the session was never started or has been evicted
         """
         try:
-            # Get conversation history
-            history = self.get_conversation_history(session_id)
-
-            # Add user message to history
-            self.add_to_history(session_id, "user", user_text)
-
-            # Generate response
-            response_text = await self.client.generate_response(
-                user_text,
-                conversation_history=history
-            )
-
-            # Add assistant response to history
-            self.add_to_history(session_id, "assistant", response_text)
+            # One turn at a time per session so history entries never interleave
+            lock = self._session_locks.get(session_id)
+            if lock is None:
+                raise ValueError(f"Unknown voice chat session: {session_id}")
+            async with lock:
+                # Snapshot the prompt window before recording the user message
+                # (generate_response appends the user message itself)
+                history = self.get_prompt_window(session_id)
+
+                # Add user message to history
+                self.add_to_history(session_id, "user", user_text)
+
+                # Generate response
+                response_text = await self.client.generate_response(
+                    user_text,
+                    conversation_history=history or None
+                )
+
+                # Add assistant response to history
+                self.add_to_history(session_id, "assistant", response_text)
 
             logger.info(f"Generated response: {response_text[:100]}...")
             return response_text
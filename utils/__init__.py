@@ -1,6 +1,9 @@
 """Utilities package."""
 
 from .exceptions import (
+    CONVERSATION_NOT_FOUND,
+    INVALID_REQUEST,
+    PERPLEXITY_API_ERROR,
     ConversationNotFoundError,
     GamingSearchError,
     InvalidRequestError,
@@ -9,13 +12,18 @@ from .exceptions import (
 from .text_processing import (
     clean_perplexity_response,
     remove_think_tags,
+    trim_conversation_history,
 )
 
 __all__ = [
+    "CONVERSATION_NOT_FOUND",
+    "INVALID_REQUEST",
+    "PERPLEXITY_API_ERROR",
     "ConversationNotFoundError",
     "GamingSearchError",
     "InvalidRequestError",
     "PerplexityAPIError",
     "clean_perplexity_response",
     "remove_think_tags",
+    "trim_conversation_history",
 ]
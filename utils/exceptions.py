@@ -1,5 +1,12 @@
 """Custom exception classes for the Gaming Chat API."""
 
+from typing import Final
+
+# Error codes carried by GamingSearchError.error_code (compare against these)
+PERPLEXITY_API_ERROR: Final = "perplexity_api_error"
+CONVERSATION_NOT_FOUND: Final = "conversation_not_found"
+INVALID_REQUEST: Final = "invalid_request"
+
 
 class GamingSearchError(Exception):
     """Base exception for Gaming Chat operations."""
@@ -14,7 +21,7 @@ class PerplexityAPIError(GamingSearchError):
     """Exception for Perplexity API related errors."""
 
     def __init__(self, message: str, status_code: int | None = None) -> None:
-        super().__init__(message, "perplexity_api_error")
+        super().__init__(message, PERPLEXITY_API_ERROR)
         self.status_code = status_code
 
 
@@ -24,7 +31,7 @@ class ConversationNotFoundError(GamingSearchError):
     def __init__(self, conversation_id: str) -> None:
         super().__init__(
             f"Conversation with ID {conversation_id} not found",
-            "conversation_not_found",
+            CONVERSATION_NOT_FOUND,
         )
         self.conversation_id = conversation_id
 
@@ -33,4 +40,4 @@ class InvalidRequestError(GamingSearchError):
     """Exception for invalid requests."""
 
     def __init__(self, message: str) -> None:
-        super().__init__(message, "invalid_request")
+        super().__init__(message, INVALID_REQUEST)
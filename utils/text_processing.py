@@ -1,8 +1,22 @@
 """Text processing utilities for response formatting."""
 
 import re
+from collections.abc import Sequence
 from typing import Any
 
+from perplexity.types.chat import CompletionCreateResponse
+
+# Matches <think>...</think> blocks (DOTALL so the content may span lines)
+_THINK_TAG_PATTERN = re.compile(r"<think>.*?</think>\s*", re.DOTALL | re.IGNORECASE)
+
+# Opening tag probe (a C-level scan, without allocating a lowercased copy)
+_THINK_OPEN_TAG_PATTERN = re.compile(r"<think>", re.IGNORECASE)
+
+# Perplexity models that emit <think> reasoning traces
+_REASONING_MODELS = frozenset(
+    {"sonar-reasoning", "sonar-reasoning-pro", "sonar-deep-research"}
+)
+
 
 def remove_think_tags(text: str) -> str:
     """
@@ -26,18 +40,20 @@ def remove_think_tags(text: str) -> str:
         >>> remove_think_tags(text)
         "Response without think tags"
     """
-    # Pattern to match <think>...</think> tags including content within them
-    # Using DOTALL flag to match newlines within the tags
-    think_pattern = r"<think>.*?</think>\s*"
+    # Most responses have no think tags, so skip the regex for them
+    if _THINK_OPEN_TAG_PATTERN.search(text) is None:
+        return text.strip()
 
     # Remove all think tag blocks
-    cleaned_text = re.sub(think_pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
+    cleaned_text = _THINK_TAG_PATTERN.sub("", text)
 
     # Strip any leading/trailing whitespace that might be left
     return cleaned_text.strip()
 
 
-def clean_perplexity_response(response: Any) -> Any:
+def clean_perplexity_response(
+    response: CompletionCreateResponse,
+) -> CompletionCreateResponse:
     """
     Clean Perplexity API response by removing think tags from the content.
 
@@ -45,17 +61,96 @@ def clean_perplexity_response(response: Any) -> Any:
     while preserving the rest of the response structure.
 
     Args:
-        response: Perplexity API response object
+        response: Perplexity chat completion response
 
     Returns:
         Response object with cleaned content
     """
-    if not hasattr(response, "choices") or not response.choices:
+    # Only reasoning models emit think tags
+    if response.model not in _REASONING_MODELS:
         return response
 
-    # Clean the content in each choice
+    # Clean the text content in each choice (structured content is left as is)
     for choice in response.choices:
-        if hasattr(choice, "message") and hasattr(choice.message, "content"):
-            choice.message.content = remove_think_tags(choice.message.content)
+        content = choice.message.content
+        if isinstance(content, str):
+            cleaned = remove_think_tags(content)
+            # str.strip() returns the same object when there is nothing to trim
+            if cleaned is not content:
+                choice.message.content = cleaned
 
     return response
+
+
+def _role_and_content(message: Any) -> tuple[str, str]:
+    """Read role and content from a role/content dict or an attribute object."""
+    if isinstance(message, dict):
+        return message["role"], message["content"]
+    return message.role, message.content
+
+
+def trim_conversation_history(
+    messages: Sequence[Any], max_messages: int, max_chars: int
+) -> list[dict[str, Any]]:
+    """
+    Keep the most recent messages that fit within a message and size budget.
+
+    Walks the history from newest to oldest and stops once either budget is
+    exhausted. Long conversations otherwise inflate prompt tokens, cost and
+    latency on every request. System messages are skipped (callers supply the
+    system prompt themselves), and role/content dicts are only built for the
+    messages that are kept.
+
+    The latest exchange is always kept, so a short reply to a follow-up
+    question still has its context: the question is kept whole and an
+    overlong answer is cut down to its end (where the follow-up question is)
+    to fit the remaining budget.
+
+    Args:
+        messages: Conversation messages (role/content dicts or objects with
+            role and content attributes) in chronological order
+        max_messages: Maximum number of messages to keep
+        max_chars: Maximum total content length to keep (roughly 4 chars/token)
+
+    Returns:
+        The most recent messages as role/content dicts in chronological order,
+        starting with a user message so roles still alternate after the system
+        prompt
+    """
+    # Reserve room for the latest question before trimming the answers after it
+    latest_question_chars = 0
+    for message in reversed(messages):
+        role, content = _role_and_content(message)
+        if role == "user":
+            latest_question_chars = len(content)
+            break
+
+    kept: list[tuple[str, str]] = []
+    total_chars = 0
+    has_question = False
+    for message in reversed(messages):
+        role, content = _role_and_content(message)
+        if role == "system":
+            continue
+        if len(kept) >= max_messages:
+            break
+        if total_chars + len(content) > max_chars:
+            # Over budget: stop once the latest exchange is complete, otherwise
+            # keep the question whole and the end of the answer
+            if has_question:
+                break
+            if role != "user":
+                room = max_chars - total_chars - latest_question_chars
+                if room <= 0:
+                    continue
+                content = content[-room:]
+        total_chars += len(content)
+        kept.append((role, content))
+        has_question = has_question or role == "user"
+
+    # Drop a leading assistant reply whose question fell out of the window
+    # (kept is newest first, so the oldest message is at the end)
+    while kept and kept[-1][0] != "user":
+        kept.pop()
+
+    return [{"role": role, "content": content} for role, content in reversed(kept)]